@@ -0,0 +1,49 @@
+# cython: language_level=3, boundscheck=False, wraparound=False
+"""
+Compiled kernel for mcq_parse.parse_answer_text
+
+Build in place (mcq_parse picks it up automatically when importable):
+    cythonize -i _mcq_parse.pyx
+"""
+
+
+def parse(str s):
+    """
+    Parses MCQ answers from a text string in a single character scan.
+
+    Matches the pure-Python parser in mcq_parse: each run of digits is paired
+    with the first A-D option (either case) that follows it, and any other
+    character only separates runs.
+
+    Args:
+        s (str): Text containing question numbers and answer options
+
+    Returns:
+        dict: Dictionary mapping question numbers to answer options
+    """
+    cdef Py_ssize_t i, n = len(s), start = -1
+    cdef Py_UCS4 ch
+    cdef dict answers = {}
+    cdef object q_no = None
+
+    for i in range(n):
+        ch = s[i]
+        if u'0' <= ch <= u'9':
+            if start < 0:
+                start = i
+            continue
+
+        # End of a digit run: it becomes the pending question number
+        if start >= 0:
+            q_no = s[start:i]
+            start = -1
+
+        if q_no is not None:
+            if u'A' <= ch <= u'D':
+                answers[q_no] = ch
+                q_no = None
+            elif u'a' <= ch <= u'd':
+                answers[q_no] = <Py_UCS4>(<unsigned int>ch - 32)
+                q_no = None
+
+    return answers
@@ -7,70 +7,44 @@ and evaluates the student's performance.
 
 import json
 import sys
+from bisect import bisect_right
 
+from mcq_parse import parse_answer_text
 
-def parse_answer_text(answer_text):
-    """
-    Parses MCQ answers from a text string.
-
-    The text can be in multiple formats:
-    1. Each line contains a question number and answer: "1A", "2B", etc.
-    2. Space-separated pairs: "1 A 2 B 3 C 4 D"
-    3. Adjacent pairs without spaces: "1A2B3C4D"
-
-    Args:
-        answer_text (str): Text containing question numbers and answer options
-
-    Returns:
-        dict: Dictionary mapping question numbers to answer options
-    """
-    import re
-
-    # Handle empty input
-    if not answer_text:
-        return {}
-
-    answers = {}
-
-    # Convert to uppercase for case-insensitive comparison
-    text = answer_text.strip().upper()
-
-    # Try to parse as space-separated format first (most common in the JSON)
-    # This handles formats like "1 A 2 B 3 C 4 D"
-    space_separated_matches = re.finditer(r'(\d+)\s+([A-D])', text)
+# orjson is optional; fall back to the stdlib json module when it is missing
+try:
+    import orjson
+except ImportError:
+    orjson = None
 
-    for match in space_separated_matches:
-        q_no = match.group(1)
-        option = match.group(2)
-        answers[q_no] = option
 
-    # If no answers were found, try to parse as adjacent pairs
-    # This handles formats like "1A2B3C4D"
-    if not answers:
-        adjacent_pairs_matches = re.finditer(r'(\d+)([A-D])', text)
+def json_loads(text):
+    """Parses JSON text, using orjson when available."""
+    if orjson is not None:
+        return orjson.loads(text)
+    return json.loads(text)
 
-        for match in adjacent_pairs_matches:
-            q_no = match.group(1)
-            option = match.group(2)
-            answers[q_no] = option
 
-    # If still no answers, try to parse as newline-separated format
-    if not answers and '\n' in text:
-        lines = text.split('\n')
+def json_dumps(obj):
+    """Serializes obj as JSON indented by two spaces, using orjson when available."""
+    if orjson is not None:
+        return orjson.dumps(obj, option=orjson.OPT_INDENT_2).decode()
+    return json.dumps(obj, indent=2)
 
-        for line in lines:
-            trimmed = line.strip()
-            if trimmed:
-                # Try to extract any digit and any A-D letter from each line
-                q_no_match = re.search(r'(\d+)', trimmed)
-                option_match = re.search(r'([A-D])', trimmed)
 
-                if q_no_match and option_match:
-                    q_no = q_no_match.group(1)
-                    option = option_match.group(1)
-                    answers[q_no] = option
+# Lower bounds (in %) of the Average, Good and Excellent performance labels
+_LABEL_CUTS = (50, 70, 90)
+_LABELS = ('Poor', 'Average', 'Good', 'Excellent')
 
-    return answers
+# Fixed text around the per-question lines in format_results
+_RULE = '===========================================\n'
+_RESULTS_HEADER = (
+    '\n' + _RULE
+    + 'MCQ Answer Evaluation Results\n'
+    + _RULE + '\n'
+    + 'Detailed Results:\n'
+    + '-------------------------------------------\n'
+)
 
 
 def evaluate_mcq(model_answer_text, student_answer_text):
@@ -88,40 +62,111 @@ def evaluate_mcq(model_answer_text, student_answer_text):
     model_answers = parse_answer_text(model_answer_text)
     student_answers = parse_answer_text(student_answer_text)
 
-    score = 0
+    return _score(model_answers, student_answers)
+
+
+def _score(model_answers, student_answers):
+    """
+    Scores already-parsed answers.
+
+    Args:
+        model_answers (dict): Question numbers mapped to model answer options
+        student_answers (dict): Question numbers mapped to student answer options
+
+    Returns:
+        dict: Evaluation result with score, total, and detailed results
+    """
+    # (q_no, option) pairs the student got right; dict item views are set-like
+    correct = model_answers.items() & student_answers.items()
+
+    score = len(correct)
     total = len(model_answers)
+
+    # Build detailed results for each question in the model answers
+    results = {
+        q_no: {
+            'correctOption': correct_option,
+            'studentOption': student_answers.get(q_no),
+            'isCorrect': (q_no, correct_option) in correct
+        }
+        for q_no, correct_option in model_answers.items()
+    }
+
+    return {
+        'score': score,
+        'total': total,
+        'results': results,
+        'percentage': _percentage(score, total)
+    }
+
+
+def _score_and_format(model_answers, student_answers):
+    """
+    Scores already-parsed answers and builds the formatted output in one pass.
+
+    Equivalent to evaluate_mcq followed by format_results, without walking
+    the results a second time.
+
+    Args:
+        model_answers (dict): Question numbers mapped to model answer options
+        student_answers (dict): Question numbers mapped to student answer options
+
+    Returns:
+        dict: Evaluation result with score, total, details, and formatted output
+    """
+    score = 0
     results = {}
+    parts = [_RESULTS_HEADER]
 
-    # Compare answers for each question in the model answers
     for q_no, correct_option in model_answers.items():
         student_option = student_answers.get(q_no)
+        is_correct = student_option == correct_option
+        score += is_correct
+
+        results[q_no] = {
+            'correctOption': correct_option,
+            'studentOption': student_option,
+            'isCorrect': is_correct
+        }
+        parts.append(_question_line(q_no, is_correct, correct_option, student_option))
 
-        # Check if student answered this question correctly
-        if student_option == correct_option:
-            score += 1
-            results[q_no] = {
-                'correctOption': correct_option,
-                'studentOption': student_option,
-                'isCorrect': True
-            }
-        else:
-            results[q_no] = {
-                'correctOption': correct_option,
-                'studentOption': student_option if student_option else None,
-                'isCorrect': False
-            }
-
-    # Calculate percentage
-    percentage = round((score / total) * 100) if total > 0 else 0
+    total = len(model_answers)
+    percentage = _percentage(score, total)
+    parts.append(_results_footer(score, total, percentage))
 
     return {
         'score': score,
         'total': total,
         'results': results,
-        'percentage': percentage
+        'percentage': percentage,
+        'formattedOutput': ''.join(parts)
     }
 
 
+def _percentage(score, total):
+    """Returns score as a whole-number percentage of total (0 if total is 0)."""
+    return round((score / total) * 100) if total > 0 else 0
+
+
+def _performance_label(percentage):
+    """Returns the performance label for a percentage score."""
+    return _LABELS[bisect_right(_LABEL_CUTS, percentage)]
+
+
+def _question_line(q_no, is_correct, correct_option, student_option):
+    """Returns the formatted output line for one question."""
+    status = '✓' if is_correct else '✗'
+    return f"Question {q_no}: {status} | Model: {correct_option} | Student: {student_option or 'No answer'}\n"
+
+
+def _results_footer(score, total, percentage):
+    """Returns the final score and performance lines of the formatted output."""
+    return (
+        f"\n{_RULE}Final Score: {score}/{total} ({percentage}%)\n{_RULE}"
+        f"Performance: {_performance_label(percentage)}\n"
+    )
+
+
 def format_results(evaluation_result):
     """
     Formats the evaluation results as a string.
@@ -137,38 +182,16 @@ def format_results(evaluation_result):
     results = evaluation_result['results']
     percentage = evaluation_result['percentage']
 
-    output = '\n===========================================\n'
-    output += 'MCQ Answer Evaluation Results\n'
-    output += '===========================================\n\n'
+    parts = [_RESULTS_HEADER]
 
     # Display detailed results for each question
-    output += 'Detailed Results:\n'
-    output += '-------------------------------------------\n'
-
     for q_no, result in results.items():
-        status = '✓' if result['isCorrect'] else '✗'
-        student_answer = result['studentOption'] if result['studentOption'] else 'No answer'
-
-        output += f"Question {q_no}: {status} | Model: {result['correctOption']} | Student: {student_answer}\n"
-
-    # Display final score
-    output += '\n===========================================\n'
-    output += f"Final Score: {score}/{total} ({percentage}%)\n"
-    output += '===========================================\n'
-
-    # Add performance label
-    if percentage >= 90:
-        performance_label = 'Excellent'
-    elif percentage >= 70:
-        performance_label = 'Good'
-    elif percentage >= 50:
-        performance_label = 'Average'
-    else:
-        performance_label = 'Poor'
+        parts.append(_question_line(q_no, result['isCorrect'], result['correctOption'], result['studentOption']))
 
-    output += f"Performance: {performance_label}\n"
+    # Display final score and performance label
+    parts.append(_results_footer(score, total, percentage))
 
-    return output
+    return ''.join(parts)
 
 
 def process_json_input(json_input):
@@ -181,6 +204,53 @@ def process_json_input(json_input):
     Returns:
         dict: Evaluation result with score, total, details, and formatted output
     """
+    model_answers, student_answers = _get_answer_texts(json_input)
+
+    # Evaluate and format the answers in a single pass
+    return _score_and_format(parse_answer_text(model_answers), parse_answer_text(student_answers))
+
+
+def process_json_batch(json_inputs):
+    """
+    Processes a list of JSON inputs, e.g. a whole class graded against one key.
+
+    Each distinct model answer text is parsed only once and reused for every
+    submission that shares it.
+
+    Args:
+        json_inputs (list): JSON objects with model_answers and student_answers
+
+    Returns:
+        list: One evaluation result per input, as returned by process_json_input
+    """
+    parsed_models = {}
+    batch_results = []
+
+    for json_input in json_inputs:
+        model_text, student_text = _get_answer_texts(json_input)
+
+        model_answers = parsed_models.get(model_text)
+        if model_answers is None:
+            model_answers = parsed_models[model_text] = parse_answer_text(model_text)
+
+        batch_results.append(_score_and_format(model_answers, parse_answer_text(student_text)))
+
+    return batch_results
+
+
+def _get_answer_texts(json_input):
+    """
+    Extracts and validates the answer texts from a JSON input.
+
+    Args:
+        json_input (dict): JSON object with model_answers and student_answers
+
+    Returns:
+        tuple: (model_answers, student_answers) text
+
+    Raises:
+        ValueError: If either answer text is missing or empty
+    """
     # Extract model and student answers from JSON
     model_answers = json_input.get('model_answers')
     student_answers = json_input.get('student_answers')
@@ -189,16 +259,7 @@ def process_json_input(json_input):
     if not model_answers or not student_answers:
         raise ValueError('Invalid JSON input: model_answers and student_answers are required')
 
-    # Evaluate the answers
-    evaluation_result = evaluate_mcq(model_answers, student_answers)
-
-    # Format the results
-    formatted_output = format_results(evaluation_result)
-
-    # Add formatted output to the result
-    evaluation_result['formattedOutput'] = formatted_output
-
-    return evaluation_result
+    return model_answers, student_answers
 
 
 # Example usage with the provided JSON
@@ -207,7 +268,7 @@ if __name__ == "__main__":
     if len(sys.argv) > 1:
         try:
             # Parse JSON from command-line argument
-            json_input = json.loads(sys.argv[1])
+            json_input = json_loads(sys.argv[1])
         except json.JSONDecodeError:
             print("Error: Invalid JSON format")
             sys.exit(1)
@@ -227,7 +288,7 @@ if __name__ == "__main__":
 
         # Also display the raw result as JSON
         print('\nRaw Result:')
-        print(json.dumps(result, indent=2))
+        print(json_dumps(result))
     except Exception as e:
         print(f"Error: {str(e)}")
         sys.exit(1)
@@ -5,59 +5,12 @@ This script exactly matches the Python implementation provided by the user.
 """
 
 import json
+import logging
 import sys
 
+from mcq_parse import parse_answer_text
 
-def parse_answer_text(answer_text):
-    """
-    Parses MCQ answers from a text string.
-    The text is expected to be in the format: "1A 2B 3C 4D" or "1 A 2 B 3 C 4 D"
-
-    Args:
-        answer_text (str): Text containing question numbers and answer options
-
-    Returns:
-        dict: Dictionary mapping question numbers to answer options
-    """
-    import re
-
-    print("Parsing answer text:", answer_text)
-
-    # Handle empty input
-    if not answer_text:
-        return {}
-
-    answers = {}
-
-    # First try to parse as adjacent pairs (1A2B3C4D)
-    text = answer_text.upper()
-    adjacent_pairs_matches = re.finditer(r'(\d+)([A-D])', text)
-
-    for match in adjacent_pairs_matches:
-        q_no = match.group(1)
-        option = match.group(2)
-        answers[q_no] = option
-
-    # If no answers found, try space-separated format
-    if not answers:
-        # Replace newlines with spaces and trim whitespace
-        text = answer_text.replace('\n', ' ').strip().upper()
-
-        # Split by whitespace
-        parts = text.split()
-
-        # Process pairs of elements (question number and option)
-        for i in range(0, len(parts), 2):
-            # Make sure we have both question number and option
-            if i + 1 < len(parts):
-                q_no = parts[i]
-                option = parts[i+1]
-
-                # Add to answers dictionary
-                answers[q_no] = option
-
-    print("Parsed answers:", answers)
-    return answers
+log = logging.getLogger(__name__)
 
 
 def evaluate_mcq(model_answer_text, student_answer_text):
@@ -71,9 +24,12 @@ def evaluate_mcq(model_answer_text, student_answer_text):
     Returns:
         tuple: (score, total) - The score achieved and the total possible score
     """
+    log.debug("Parsing answer text: %s | %s", model_answer_text, student_answer_text)
+
     # Parse the answers
     model_answers = parse_answer_text(model_answer_text)
     student_answers = parse_answer_text(student_answer_text)
+    log.debug("Parsed answers: %s | %s", model_answers, student_answers)
 
     score = 0
     total = len(model_answers)
@@ -7,22 +7,117 @@ into your application. It includes error handling, fallback mechanisms, and
 proper formatting of the output.
 """
 
+import asyncio
+import concurrent.futures
+import functools
+import hashlib
 import os
 import re
+import shelve
 import sys
+from collections import OrderedDict
 from typing import List, Dict, Tuple, Optional
-from dotenv import load_dotenv
 
-# Load environment variables from .env file
-load_dotenv()
+# The openai package, imported on first use by _get_openai() (False if missing)
+_openai = None
 
-# Try to import the OpenAI API, with graceful fallback if not available
-try:
-    import openai
-    OPENAI_AVAILABLE = True
-except ImportError:
-    OPENAI_AVAILABLE = False
-    print("Warning: openai package not found. Using fallback mechanism.")
+
+@functools.lru_cache(maxsize=1)
+def _load_env() -> bool:
+    """Load environment variables from the .env file, once per process."""
+    from dotenv import load_dotenv
+    load_dotenv()
+    return True
+
+
+def _get_openai():
+    """
+    Import the OpenAI API on first use, with graceful fallback if not available.
+
+    Returns:
+        The openai module, or None if the package is not installed.
+    """
+    global _openai
+    if _openai is None:
+        try:
+            import openai
+            _openai = openai
+        except ImportError:
+            _openai = False
+            print("Warning: openai package not found. Using fallback mechanism.")
+    return _openai or None
+
+# Question-number split points ("Question 1." / "1." / "1)") and whitespace runs
+_QSPLIT_RE = re.compile(r'(?:Question\s+)?(\d+)[\.:\)]')
+_WS_RE = re.compile(r'\s+')
+
+# Suggested location for the persistent response cache (see MCQAnswerGenerator)
+DEFAULT_CACHE_PATH = os.path.join(os.path.expanduser("~"), ".cache", "mcq", "openai")
+
+
+class _DefaultA(dict):
+    """Answer lookup that defaults to "a" for unknown question numbers."""
+
+    def __missing__(self, key):
+        return "a"
+
+
+# Sample answers for testing - in a real scenario, these would come from the API
+# These match the answers provided in the user's example
+_SAMPLE_ANSWERS = _DefaultA({
+    "1": "b",  # Concave lens has virtual focus
+    "2": "b",  # Parallel beam of light
+    "3": "d",  # Ammeter in series, voltmeter in parallel
+    "4": "c"   # Equal to 2f
+})
+
+# In-process LRU of generated answers, keyed by question digest
+_RESPONSE_CACHE_SIZE = 512
+_response_cache: "OrderedDict[bytes, str]" = OrderedDict()
+
+
+def _cache_get(key: bytes, cache_path: Optional[str] = None) -> Optional[str]:
+    """
+    Look up previously generated answers, in memory first and then on disk.
+
+    Args:
+        key: BLAKE2b digest of the cleaned questions.
+        cache_path: Path of a shelve file shared across processes, or None.
+
+    Returns:
+        The cached answer text, or None on a miss.
+    """
+    answers = _response_cache.get(key)
+    if answers is not None:
+        _response_cache.move_to_end(key)
+        return answers
+
+    if cache_path:
+        with shelve.open(cache_path) as cache:
+            answers = cache.get(key.hex())
+        if answers is not None:
+            _cache_put(key, answers)
+
+    return answers
+
+
+def _cache_put(key: bytes, answers: str, cache_path: Optional[str] = None) -> None:
+    """
+    Remember generated answers in memory and, if cache_path is set, on disk.
+
+    Args:
+        key: BLAKE2b digest of the cleaned questions.
+        answers: The generated answer text.
+        cache_path: Path of a shelve file shared across processes, or None.
+    """
+    _response_cache[key] = answers
+    _response_cache.move_to_end(key)
+    if len(_response_cache) > _RESPONSE_CACHE_SIZE:
+        _response_cache.popitem(last=False)
+
+    if cache_path:
+        with shelve.open(cache_path) as cache:
+            cache[key.hex()] = answers
 
 # MCQ Answer Generator Class
 class MCQAnswerGenerator:
@@ -31,23 +126,26 @@ class MCQAnswerGenerator:
     Includes fallback mechanisms for when the API is unavailable or rate-limited.
     """
 
-    def __init__(self, api_key: Optional[str] = None):
+    def __init__(self, api_key: Optional[str] = None, cache_path: Optional[str] = None):
         """
         Initialize the MCQ Answer Generator.
 
         Args:
             api_key: The OpenAI API key. If None, will try to get from environment.
+            cache_path: Optional shelve file (e.g. DEFAULT_CACHE_PATH) used to keep
+                generated answers across runs. Answers are always cached in memory.
         """
+        _load_env()
+
         self.api_key = api_key or os.environ.get("OPENAI_API_KEY")
-        self.openai_available = OPENAI_AVAILABLE and self.api_key
+        self.cache_path = cache_path
 
-        if self.openai_available:
-            try:
-                openai.api_key = self.api_key
-                # No need to initialize a model instance for OpenAI
-            except Exception as e:
-                print(f"Error configuring OpenAI API: {e}")
-                self.openai_available = False
+        if cache_path:
+            os.makedirs(os.path.dirname(cache_path) or ".", exist_ok=True)
+
+        # Only pay for importing openai when there is a key to use it with;
+        # the key is passed to the client directly in _generate_all
+        self.openai_available = bool(self.api_key) and _get_openai() is not None
 
     def extract_questions(self, text: str) -> List[Tuple[str, str]]:
         """
@@ -60,7 +158,7 @@ class MCQAnswerGenerator:
             A list of tuples (question_number, question_text).
         """
         # Split by question number pattern (e.g., "Question 1." or "1.")
-        questions = re.split(r'(?:Question\s+)?(\d+)[\.:\)]', text)
+        questions = _QSPLIT_RE.split(text)
 
         # Process the split result to pair question numbers with their content
         result = []
@@ -82,33 +180,107 @@ class MCQAnswerGenerator:
         Returns:
             A string containing the answers in the format "1 b\n2 c\n3 a\n4 d".
         """
+        return self.generate_answers_batch([questions_text])[0]
+
+    def generate_answers_batch(self, texts: List[str]) -> List[str]:
+        """
+        Generate answers for several MCQ papers, overlapping the API requests.
+
+        Inside a running event loop (a Jupyter notebook, an async server) the
+        requests run on a worker thread and this call blocks until they are
+        done; async callers should await agenerate_answers_batch instead.
+
+        Args:
+            texts: The texts containing MCQ questions, one per paper.
+
+        Returns:
+            The answers for each paper, in the same order as texts.
+        """
+        try:
+            asyncio.get_running_loop()
+        except RuntimeError:
+            return asyncio.run(self.agenerate_answers_batch(texts))
+
+        # asyncio.run() refuses to start a second loop on this thread
+        with concurrent.futures.ThreadPoolExecutor(max_workers=1) as executor:
+            return executor.submit(asyncio.run, self.agenerate_answers_batch(texts)).result()
+
+    async def agenerate_answers_batch(self, texts: List[str]) -> List[str]:
+        """
+        Generate answers for several MCQ papers, overlapping the API requests.
+
+        Args:
+            texts: The texts containing MCQ questions, one per paper.
+
+        Returns:
+            The answers for each paper, in the same order as texts.
+        """
         # Clean the input text
-        clean_questions = re.sub(r'\s+', ' ', questions_text).strip()
+        clean_texts = [_WS_RE.sub(' ', text).strip() for text in texts]
 
         # Try to use OpenAI API if available
         if self.openai_available:
             try:
-                # Create the prompt
-                prompt = self._create_prompt(clean_questions)
-
-                # Generate content with the OpenAI API
-                response = openai.ChatCompletion.create(
-                    model="gpt-3.5-turbo",
-                    messages=[
-                        {"role": "system", "content": "You are a model answer generator for MCQ papers."},
-                        {"role": "user", "content": prompt}
-                    ],
-                    temperature=0.1,
-                    max_tokens=150
-                )
-
-                # Extract and return the generated text
-                return response.choices[0].message.content.strip()
+                return await self._generate_all(clean_texts)
             except Exception as e:
                 print(f"Error generating answers with OpenAI API: {e}")
                 print("Falling back to hardcoded answers.")
 
         # Fallback: Use hardcoded answers based on question patterns
+        return [self._generate_fallback_answers(text) for text in clean_texts]
+
+    async def _generate_all(self, clean_texts: List[str]) -> List[str]:
+        """
+        Issue one concurrent API request per paper over a shared async client.
+
+        Args:
+            clean_texts: The cleaned question texts.
+
+        Returns:
+            The answers for each paper, in order.
+        """
+        async with _get_openai().AsyncOpenAI(api_key=self.api_key) as client:
+            return list(await asyncio.gather(
+                *(self._generate_async(client, text) for text in clean_texts)
+            ))
+
+    async def _generate_async(self, client, clean_questions: str) -> str:
+        """
+        Generate answers for one paper, reusing a cached response when possible.
+
+        Args:
+            client: The openai.AsyncOpenAI client to send the request with.
+            clean_questions: The cleaned question text.
+
+        Returns:
+            A string containing the answers in the format "1 b\n2 c\n3 a\n4 d".
+        """
+        try:
+            # Identical question sets reuse the earlier API response
+            key = hashlib.blake2b(clean_questions.encode(), digest_size=16).digest()
+            answers = _cache_get(key, self.cache_path)
+            if answers is not None:
+                return answers
+
+            # Generate content with the OpenAI API
+            response = await client.chat.completions.create(
+                model="gpt-3.5-turbo",
+                messages=[
+                    {"role": "system", "content": "You are a model answer generator for MCQ papers."},
+                    {"role": "user", "content": self._create_prompt(clean_questions)}
+                ],
+                temperature=0.1,
+                max_tokens=150
+            )
+
+            # Extract the generated text
+            answers = response.choices[0].message.content.strip()
+            _cache_put(key, answers, self.cache_path)
+            return answers
+        except Exception as e:
+            print(f"Error generating answers with OpenAI API: {e}")
+            print("Falling back to hardcoded answers.")
+
         return self._generate_fallback_answers(clean_questions)
 
     def _create_prompt(self, questions_text: str) -> str:
@@ -157,22 +329,8 @@ Generate the answers.
         # Extract questions
         questions = self.extract_questions(questions_text)
 
-        # Sample answers for testing - in a real scenario, these would come from the API
-        # These match the answers provided in the user's example
-        sample_answers = {
-            "1": "b",  # Concave lens has virtual focus
-            "2": "b",  # Parallel beam of light
-            "3": "d",  # Ammeter in series, voltmeter in parallel
-            "4": "c"   # Equal to 2f
-        }
-
         # Format the answers
-        formatted_answers = []
-        for num, _ in questions:
-            answer = sample_answers.get(num, "a")  # Default to "a" if question number not found
-            formatted_answers.append(f"{num} {answer}")
-
-        return "\n".join(formatted_answers)
+        return "\n".join(f"{num} {_SAMPLE_ANSWERS[num]}" for num, _ in questions)
 
 # Example usage
 def main():
@@ -5,54 +5,121 @@ Command-line interface for MCQ answer evaluation
 Usage:
     python mcq_cli.py '{"model_answers": "1A 2B 3C 4D", "student_answers": "1 a 2 b 3 c 4 d"}'
     python mcq_cli.py --model "1A 2B 3C 4D" --student "1 a 2 b 3 c 4 d"
+    python mcq_cli.py '[{"model_answers": "1A 2B", "student_answers": "1 a 2 c"}, {"model_answers": "1A 2B", "student_answers": "1 b 2 b"}]'
 """
 
 import json
 import sys
-import argparse
-from evaluate_mcq_json import process_json_input
+
+USAGE = 'usage: mcq_cli.py [-h] [--model MODEL --student STUDENT] [--json] [json_input]'
+
+HELP = USAGE + """
+
+Evaluate MCQ answers
+
+positional arguments:
+  json_input         JSON input with model_answers and student_answers, or a JSON array of such inputs
+
+options:
+  -h, --help         show this help message and exit
+  --model MODEL      Model answers (e.g., "1A 2B 3C 4D")
+  --student STUDENT  Student answers (e.g., "1 a 2 b 3 c 4 d")
+  --json             Output raw result as JSON"""
+
+
+def _usage_error(message):
+    """Print a usage error and exit with status 2, like argparse does"""
+    print(USAGE, file=sys.stderr)
+    print(f'mcq_cli.py: error: {message}', file=sys.stderr)
+    sys.exit(2)
+
+
+def _parse_args(argv):
+    """
+    Parse command-line arguments by hand.
+
+    argparse is avoided because importing it noticeably slows start-up when
+    the CLI is run once per paper from shell scripts.
+
+    Args:
+        argv (list): Arguments without the program name
+
+    Returns:
+        tuple: (json_input, model, student, show_json)
+    """
+    json_input = model = student = None
+    show_json = False
+
+    args = iter(argv)
+    for arg in args:
+        # --model=VALUE / --student=VALUE, as argparse accepts
+        option, equals, inline_value = arg.partition('=')
+        if equals and option in ('--model', '--student'):
+            arg = option
+
+        if arg in ('-h', '--help'):
+            print(HELP)
+            sys.exit(0)
+        elif arg == '--json':
+            show_json = True
+        elif arg in ('--model', '--student'):
+            value = inline_value if equals else next(args, None)
+            if value is None:
+                _usage_error(f'argument {arg}: expected one argument')
+            if arg == '--model':
+                model = value
+            else:
+                student = value
+        elif json_input is None:
+            json_input = arg
+        else:
+            _usage_error(f'unrecognized arguments: {arg}')
+
+    if json_input is None and model is None:
+        _usage_error('one of the arguments json_input --model is required')
+    if json_input is not None and model is not None:
+        _usage_error('argument --model: not allowed with argument json_input')
+    if model is not None and not student:
+        _usage_error('--student is required when using --model')
+
+    return json_input, model, student, show_json
 
 
 def main():
     """Main function for the command-line interface"""
-    # Create argument parser
-    parser = argparse.ArgumentParser(description='Evaluate MCQ answers')
-    
-    # Add arguments
-    group = parser.add_mutually_exclusive_group(required=True)
-    group.add_argument('json_input', nargs='?', help='JSON input with model_answers and student_answers')
-    group.add_argument('--model', help='Model answers (e.g., "1A 2B 3C 4D")')
+    json_text, model, student, show_json = _parse_args(sys.argv[1:])
     
-    parser.add_argument('--student', help='Student answers (e.g., "1 a 2 b 3 c 4 d")')
-    parser.add_argument('--json', action='store_true', help='Output raw result as JSON')
-    
-    # Parse arguments
-    args = parser.parse_args()
+    # Imported here so that usage errors and --help return without loading it
+    from evaluate_mcq_json import json_dumps, json_loads, process_json_batch, process_json_input
     
     try:
         # Check if using named arguments
-        if args.model:
-            if not args.student:
-                parser.error('--student is required when using --model')
-            
+        if model:
             json_input = {
-                'model_answers': args.model,
-                'student_answers': args.student
+                'model_answers': model,
+                'student_answers': student
             }
         else:
             # Parse JSON from command-line argument
-            json_input = json.loads(args.json_input)
-        
-        # Process the JSON input
-        result = process_json_input(json_input)
+            json_input = json_loads(json_text)
         
-        # Display the formatted output
-        print(result['formattedOutput'])
+        # A JSON array is graded as a batch, sharing parsed answer keys
+        if isinstance(json_input, list):
+            result = process_json_batch(json_input)
+            
+            for item in result:
+                print(item['formattedOutput'])
+        else:
+            # Process the JSON input
+            result = process_json_input(json_input)
+            
+            # Display the formatted output
+            print(result['formattedOutput'])
         
         # Also display the raw result as JSON if --json flag is provided
-        if args.json:
+        if show_json:
             print('\nRaw Result:')
-            print(json.dumps(result, indent=2))
+            print(json_dumps(result))
     
     except json.JSONDecodeError:
         print('Error: Invalid JSON format')
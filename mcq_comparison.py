@@ -5,75 +5,7 @@ This module provides functionality to evaluate student answers for multiple-choi
 by comparing them with model answers.
 """
 
-def parse_answer_text(answer_text):
-    """
-    Parses MCQ answers from a text string.
-
-    The text can be in multiple formats:
-    1. Each line contains a question number and answer: "1A", "2B", etc.
-    2. Space-separated pairs: "1 A 2 B 3 C 4 D"
-
-    Args:
-        answer_text (str): Text containing question numbers and answer options
-
-    Returns:
-        dict: Dictionary mapping question numbers to answer options
-    """
-    # Handle empty input
-    if not answer_text:
-        return {}
-
-    answers = {}
-
-    # First, try to parse as newline-separated format (1A, 2B, etc.)
-    if '\n' in answer_text:
-        lines = answer_text.split('\n')
-
-        for line in lines:
-            trimmed = line.strip().upper()
-            if trimmed:
-                # Try to extract question number and option
-                import re
-
-                # Try to match formats like "1A" or "1 A"
-                match = re.match(r'^(\d+)\s*([A-D])$', trimmed)
-
-                if match:
-                    q_no = match.group(1)
-                    option = match.group(2)
-                    answers[q_no] = option
-                else:
-                    # Try to extract any digit and any A-D letter
-                    q_no_match = re.search(r'(\d+)', trimmed)
-                    option_match = re.search(r'([A-D])', trimmed)
-
-                    if q_no_match and option_match:
-                        q_no = q_no_match.group(1)
-                        option = option_match.group(1)
-                        answers[q_no] = option
-
-    # If no answers were parsed from newlines, try space-separated format
-    if not answers:
-        # Replace newlines with spaces and trim whitespace
-        text = answer_text.replace('\n', ' ').strip().upper()
-
-        # Split by whitespace
-        parts = text.split()
-
-        # Process pairs of elements (question number and option)
-        for i in range(0, len(parts), 2):
-            # Make sure we have both question number and option
-            if i + 1 < len(parts):
-                q_no = parts[i]
-                option = parts[i+1]
-
-                # Validate question number (should be a number)
-                if q_no.isdigit():
-                    # Validate option (should be A, B, C, or D)
-                    if option in ['A', 'B', 'C', 'D']:
-                        answers[q_no] = option
-
-    return answers
+from mcq_parse import parse_answer_text
 
 
 def evaluate_mcq(model_answer_text, student_answer_text):
@@ -91,14 +23,10 @@ def evaluate_mcq(model_answer_text, student_answer_text):
     model_answers = parse_answer_text(model_answer_text)
     student_answers = parse_answer_text(student_answer_text)
 
-    score = 0
+    # Count questions where the student's (q_no, option) pair matches the model's
+    score = len(model_answers.items() & student_answers.items())
     total = len(model_answers)
 
-    # Compare answers for each question in the model answers
-    for q_no, correct_option in model_answers.items():
-        if student_answers.get(q_no) == correct_option:
-            score += 1
-
     return score, total
 
 
@@ -0,0 +1,162 @@
+"""
+MCQ Answer Parsing
+
+Shared parser for MCQ answer strings, used by evaluate_mcq_json.py,
+exact_mcq_comparison.py and mcq_comparison.py.
+
+If the optional Cython kernel in _mcq_parse.pyx has been built
+(cythonize -i _mcq_parse.pyx), it is used in place of the pure-Python scan.
+"""
+
+import re
+from itertools import groupby
+
+try:
+    from _mcq_parse import parse as _parse_compiled
+except ImportError:
+    _parse_compiled = None
+
+
+class _TranslateTable(dict):
+    """str.translate table that maps every character it does not list to a default."""
+
+    def __init__(self, default, mapping=()):
+        super().__init__(mapping)
+        self.default = default
+
+    def __missing__(self, key):
+        return self.default
+
+
+# Keeps digits and A-D (folding a-d to upper case); everything else becomes
+# a space. All of ASCII is listed so translate() never hits __missing__ for
+# plain-ASCII input.
+_ANSWER_TABLE = _TranslateTable(' ', {code: ' ' for code in range(128)})
+_ANSWER_TABLE.update({ord(c): c for c in '0123456789ABCD'})
+_ANSWER_TABLE.update({ord(c.lower()): c for c in 'ABCD'})
+
+# Reduces text to its "shape": D for a digit, U/L for an upper/lower case
+# option and "." for anything else, so "1A 2b" has the shape "DU.DL"
+_SHAPE_TABLE = _TranslateTable('.', {code: '.' for code in range(128)})
+_SHAPE_TABLE.update({ord(c): 'D' for c in '0123456789'})
+_SHAPE_TABLE.update({ord(c): 'U' for c in 'ABCD'})
+_SHAPE_TABLE.update({ord(c): 'L' for c in 'abcd'})
+
+# A question number and the option it is paired with, within a shape
+_SHAPE_PAIR = re.compile(r'(?<!D)(D+)\.*([UL])')
+
+# Inputs up to this length get a generated parser once the same shape has
+# been seen _SPECIALIZE_AFTER times (answer strings in one exam share a shape).
+# Generated parsers are kept for the life of the process; once _MAX_PARSERS
+# exist, new shapes go through _parse rather than evicting and regenerating.
+_MAX_SHAPE_LENGTH = 256
+_SPECIALIZE_AFTER = 3
+_MAX_TRACKED_SHAPES = 1024
+_MAX_PARSERS = 64
+_shape_hits = {}
+_parsers = {}
+
+
+def parse_answer_text(answer_text):
+    """
+    Parses MCQ answers from a text string.
+
+    The text can be in multiple formats:
+    1. Each line contains a question number and answer: "1A", "2B", etc.
+    2. Space-separated pairs: "1 A 2 B 3 C 4 D"
+    3. Adjacent pairs without spaces: "1A2B3C4D"
+
+    Each question number is paired with the first A-D option that follows it.
+
+    Args:
+        answer_text (str): Text containing question numbers and answer options
+
+    Returns:
+        dict: Dictionary mapping question numbers to answer options
+    """
+    # Handle empty input
+    if not answer_text:
+        return {}
+
+    # The compiled kernel beats the generated parsers, so they are only used
+    # with the pure-Python scan
+    if _parse_compiled is None and len(answer_text) <= _MAX_SHAPE_LENGTH:
+        shape = answer_text.translate(_SHAPE_TABLE)
+        parser = _parsers.get(shape)
+        if parser is not None:
+            return parser(answer_text)
+
+        if len(_parsers) < _MAX_PARSERS:
+            hits = _shape_hits.get(shape, 0) + 1
+            if hits >= _SPECIALIZE_AFTER:
+                # pop, not del: another thread may already have removed it
+                _shape_hits.pop(shape, None)
+                parser = _parsers[shape] = _make_parser(shape)
+                return parser(answer_text)
+
+            if len(_shape_hits) >= _MAX_TRACKED_SHAPES:
+                _shape_hits.clear()
+            _shape_hits[shape] = hits
+
+    return _parse(answer_text)
+
+
+def _make_parser(shape):
+    """
+    Generates a parser specialized for one input shape.
+
+    The generated function slices the answers straight out of the text at
+    the offsets the shape fixes, e.g. for "DU.DU" (as in "1A 2B"):
+
+        def parse(t):
+            return {t[0:1]: t[1], t[3:4]: t[4]}
+
+    Args:
+        shape (str): Text translated with _SHAPE_TABLE
+
+    Returns:
+        function: Parser equivalent to parse_answer_text for that shape
+    """
+    items = []
+    for match in _SHAPE_PAIR.finditer(shape):
+        start, end = match.span(1)
+        option = match.start(2)
+        upper = '.upper()' if match.group(2) == 'L' else ''
+        items.append(f't[{start}:{end}]: t[{option}]{upper}')
+
+    namespace = {}
+    exec(f"def parse(t):\n    return {{{', '.join(items)}}}\n", namespace)
+    return namespace['parse']
+
+
+def _parse_py(answer_text):
+    """Pure-Python parser used when the _mcq_parse extension is not built."""
+    answers = {}
+    q_no = None
+
+    # Reduce the text to runs of digits and options separated by whitespace,
+    # e.g. "1. a) 2-B" -> "1  A  2 B", then walk the runs in order
+    for token in answer_text.translate(_ANSWER_TABLE).split():
+        if token.isdigit():
+            q_no = token
+        elif token.isalpha():
+            if q_no is not None:
+                answers[q_no] = token[0]
+                q_no = None
+        elif token[:-1].isdigit():
+            # Already-normalized pair such as "12A", the most common shape
+            answers[token[:-1]] = token[-1]
+            q_no = None
+        else:
+            # Mixed run such as "1A2B3C4D": split at digit/letter boundaries
+            for is_digit, run in groupby(token, str.isdigit):
+                if is_digit:
+                    q_no = ''.join(run)
+                elif q_no is not None:
+                    answers[q_no] = next(run)
+                    q_no = None
+
+    return answers
+
+
+_parse = _parse_compiled if _parse_compiled is not None else _parse_py
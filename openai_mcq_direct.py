@@ -10,15 +10,6 @@ Usage:
 """
 
 import os
-import openai
-from dotenv import load_dotenv
-
-# Load environment variables from .env file
-load_dotenv()
-
-# Configure the OpenAI API with your API key
-API_KEY = os.getenv("OPENAI_API_KEY", "")  # Get API key from environment variable
-openai.api_key = API_KEY
 
 # Sample MCQ questions
 questions = """
@@ -56,13 +47,24 @@ Generate the answers.
 """
 
 def main():
+    # Load environment variables from .env file
+    from dotenv import load_dotenv
+    load_dotenv()
+
+    # Get API key from environment variable
+    api_key = os.getenv("OPENAI_API_KEY", "")
+
     try:
         # Check if API key is set
-        if not API_KEY:
+        if not api_key:
             raise ValueError("OpenAI API key is not set. Please set it in the .env file.")
 
-        # Create a request to the OpenAI API
-        response = openai.ChatCompletion.create(
+        # Imported here so the module loads without paying for the openai package
+        import openai
+
+        # Create a request to the OpenAI API (openai>=1.0 client)
+        client = openai.OpenAI(api_key=api_key)
+        response = client.chat.completions.create(
             model="gpt-3.5-turbo",
             messages=[
                 {"role": "system", "content": "You are a model answer generator for CLASS-X SCIENCE PRACTICAL SKILLS AND TECHNOLOGY MCQ papers."},
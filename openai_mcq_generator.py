@@ -13,23 +13,66 @@ Usage:
 
     Or with a specific prompt:
     python openai_mcq_generator.py --prompt "Your custom prompt" --file questions.txt
+
+    Or for many files at once (concurrent requests, or the cheaper Batch API):
+    python openai_mcq_generator.py --file "papers/*.txt"
+    python openai_mcq_generator.py --file "papers/*.txt" --batch
+
+The script is pure Python and also runs under PyPy (pypy3 -m pip install openai
+python-dotenv), which speeds up cleaning and splitting large question files;
+run-mcq-generator-pypy.bat uses pypy3 when it is on the PATH.
+
+Requires openai>=1.0.
 """
 
 import os
 import sys
 import argparse
+import asyncio
+import glob
+import hashlib
+import json
+import mmap
 import re
-import openai
-from dotenv import load_dotenv
-
-# Load environment variables from .env file
-load_dotenv()
-
-# Get API key from environment variable
-API_KEY = os.getenv("OPENAI_API_KEY", "")
-
-# Configure the OpenAI API
-openai.api_key = API_KEY
+import sqlite3
+import stat
+import time
+from functools import lru_cache
+
+# google-re2 (optional) splits whole exam banks into questions faster than re
+try:
+    import re2
+except ImportError:
+    re2 = re
+
+# The API key is read by _load_env() and the openai package imported by
+# _ensure_openai() on first use, so that --help, argument errors and the
+# no-key fallback do not pay for importing openai
+_openai = None
+_client = None
+API_KEY = ""
+
+# Request settings; they are part of the response cache key
+MODEL = "gpt-3.5-turbo"
+TEMPERATURE = 0.1
+MAX_TOKENS = 150
+
+# Each "<num> <letter>" answer line takes about 3 tokens; MAX_TOKENS is used
+# for custom prompts and when no question numbers are found
+TOKENS_PER_QUESTION = 6
+
+# Logit bias towards the tokens answer lines are made of
+_ANSWER_CHARS = "abcd0123456789 \n"
+_ANSWER_BIAS = 5
+
+# Exact-match response cache shared across runs (see generate_mcq_answers)
+CACHE_DIR = os.path.join(os.path.expanduser("~"), ".cache", "lysaapp", "mcq")
+CACHE_PATH = os.path.join(CACHE_DIR, "responses.sqlite")
+_cache_conn = None
+
+# Patterns used by clean_text and extract_mcq_questions
+_WS_RE = re.compile(r'\s+')
+_Q_SPLIT_RE = re2.compile(r'(?:Question\s+)?(\d+)[\.:\)]')
 
 # Default prompt template for MCQ answer generation
 DEFAULT_PROMPT_TEMPLATE = """
@@ -56,88 +99,468 @@ Generate the answers.
 """
 
 def clean_text(text):
-    """Clean the input text by removing extra whitespace and normalizing line breaks."""
-    # Replace multiple spaces with a single space
-    text = re.sub(r'\s+', ' ', text)
-    # Replace multiple newlines with a single newline
-    text = re.sub(r'\n+', '\n', text)
-    return text.strip()
+    """Clean the input text by collapsing every run of whitespace, line breaks included, to one space."""
+    return _WS_RE.sub(' ', text).strip()
 
 def extract_mcq_questions(text):
     """Extract individual MCQ questions from the input text."""
-    # Split by question number pattern (e.g., "Question 1." or "1.")
-    questions = re.split(r'(?:Question\s+)?(\d+)[\.:\)]', text)
-
-    # Process the split result to pair question numbers with their content
+    # Each question runs from the end of its number (e.g., "Question 1." or "1.")
+    # to the start of the next one
     result = []
-    for i in range(1, len(questions), 2):
-        if i+1 < len(questions):
-            question_num = questions[i].strip()
-            question_text = questions[i+1].strip()
-            result.append((question_num, question_text))
+    match = None
+    for next_match in _Q_SPLIT_RE.finditer(text):
+        if match:
+            result.append((match.group(1), text[match.end():next_match.start()].strip()))
+        match = next_match
+    if match:
+        result.append((match.group(1), text[match.end():].strip()))
 
     return result
 
-def generate_mcq_answers(questions_text, custom_prompt=None):
-    """Generate answers for MCQ questions using the OpenAI API."""
+@lru_cache(maxsize=1)
+def _load_env():
+    """Load the .env file and read the API key into API_KEY, once per process."""
+    global API_KEY
+    from dotenv import load_dotenv
+
+    # Load environment variables from .env file
+    load_dotenv()
+    API_KEY = os.getenv("OPENAI_API_KEY", "")
+
+def _ensure_openai():
+    """Import openai on first use; only needed once an API key is set."""
+    global _openai
+    if _openai is None:
+        import openai
+        _openai = openai
+    return _openai
+
+def _openai_client():
+    """The shared synchronous OpenAI client, created on first use."""
+    global _client
+    if _client is None:
+        _client = _ensure_openai().OpenAI(api_key=API_KEY)
+    return _client
+
+def _build_prompt(clean_questions, custom_prompt=None):
+    """Fill the custom or default prompt template with the questions."""
+    if custom_prompt:
+        return custom_prompt.format(questions=clean_questions)
+    return DEFAULT_PROMPT_TEMPLATE.format(questions=clean_questions)
+
+def _messages(prompt):
+    """Chat messages sent for a prompt."""
+    return [
+        {"role": "system", "content": "You are a model answer generator for MCQ papers."},
+        {"role": "user", "content": prompt}
+    ]
+
+def _cache_key(body):
+    """Hash the request body, which determines the API response."""
+    return hashlib.blake2b(
+        json.dumps(body, sort_keys=True).encode(), digest_size=16
+    ).hexdigest()
+
+def _cache_connection():
+    """Open the SQLite response cache on first use."""
+    global _cache_conn
+    if _cache_conn is None:
+        os.makedirs(CACHE_DIR, exist_ok=True)
+        conn = sqlite3.connect(CACHE_PATH)
+        # WAL lets concurrent runs read while another one writes
+        conn.execute("PRAGMA journal_mode=WAL")
+        conn.execute("CREATE TABLE IF NOT EXISTS cache(k TEXT PRIMARY KEY, v TEXT, ts INTEGER)")
+        _cache_conn = conn
+    return _cache_conn
+
+def _cache_get(key):
+    """Return the cached response for key, or None (also if the cache is unusable)."""
+    try:
+        row = _cache_connection().execute("SELECT v FROM cache WHERE k = ?", (key,)).fetchone()
+    except (OSError, sqlite3.Error):
+        return None
+    return row[0] if row else None
+
+def _cache_put(key, value):
+    """Store a response in the cache; failures only cost the cache entry."""
+    try:
+        conn = _cache_connection()
+        with conn:
+            conn.execute("INSERT OR REPLACE INTO cache VALUES (?, ?, ?)", (key, value, int(time.time())))
+    except (OSError, sqlite3.Error) as e:
+        print(f"Warning: could not write response cache: {e}")
+
+class SemanticCache:
+    """
+    Reuses answers for question sets that are near-duplicates of earlier ones.
+
+    Questions are embedded with a small local sentence-transformers model and
+    looked up in a FAISS inner-product index of L2-normalized embeddings, so
+    scores are cosine similarities. Needs the optional sentence-transformers
+    and faiss packages; entries persist in mcq_semcache.faiss/.jsonl.
+
+    Keep the threshold high: question sets that differ only in a number or an
+    option can still score above 0.9.
+    """
+
+    def __init__(self, directory=CACHE_DIR, threshold=0.95,
+                 model_name="sentence-transformers/all-MiniLM-L6-v2"):
+        import faiss
+        from sentence_transformers import SentenceTransformer
+
+        self._faiss = faiss
+        self._model = SentenceTransformer(model_name)
+        self.threshold = threshold
+        self.directory = directory
+        self.index_path = os.path.join(directory, "mcq_semcache.faiss")
+        self.store_path = os.path.join(directory, "mcq_semcache.jsonl")
+
+        self._index = None
+        self._responses = []
+        if os.path.exists(self.index_path) and os.path.exists(self.store_path):
+            index = faiss.read_index(self.index_path)
+            with open(self.store_path, 'r', encoding='utf-8') as f:
+                responses = [json.loads(line)["response"] for line in f]
+            # A run interrupted between the two writes leaves them out of step
+            if index.ntotal == len(responses):
+                self._index = index
+                self._responses = responses
+        if self._index is None:
+            self._index = faiss.IndexFlatIP(self._model.get_sentence_embedding_dimension())
+
+    def embed(self, text):
+        """Return the normalized embedding of text as a 1 x d array."""
+        return self._model.encode([text], normalize_embeddings=True)
+
+    def lookup(self, embedding):
+        """Return the cached response closest to embedding, if similar enough."""
+        if self._index.ntotal == 0:
+            return None
+        scores, ids = self._index.search(embedding, 1)
+        if scores[0][0] >= self.threshold:
+            return self._responses[ids[0][0]]
+        return None
+
+    def add(self, embedding, text, response):
+        """Remember the response for text and persist the cache."""
+        self._index.add(embedding)
+        self._responses.append(response)
+
+        os.makedirs(self.directory, exist_ok=True)
+        with open(self.store_path, 'a', encoding='utf-8') as f:
+            f.write(json.dumps({"questions": text, "response": response}) + "\n")
+        self._faiss.write_index(self._index, self.index_path)
+
+# Sample answers for testing - in a real scenario, these would come from the API
+# These match the answers provided in the user's example
+_SAMPLE_ANSWERS = {"1": "b", "2": "b", "3": "d", "4": "c"}
+
+# Longer texts are split afresh each time rather than pinned in _extract_cached
+_EXTRACT_CACHE_MAX_CHARS = 100_000
+
+@lru_cache(maxsize=128)
+def _extract_cached(text):
+    """extract_mcq_questions as a tuple, memoized for texts that come back repeatedly."""
+    return tuple(extract_mcq_questions(text))
+
+def _extract_questions(text):
+    """extract_mcq_questions through _extract_cached, for texts short enough to keep."""
+    if len(text) < _EXTRACT_CACHE_MAX_CHARS:
+        return _extract_cached(text)
+    return extract_mcq_questions(text)
+
+def _hardcoded_fallback(questions_text):
+    """Answer every question from _SAMPLE_ANSWERS, defaulting to "a", formatted as "1 b\n2 b\n..."."""
+    return "\n".join(f"{num} {_SAMPLE_ANSWERS.get(num, 'a')}" for num, _ in _extract_questions(questions_text))
+
+@lru_cache(maxsize=1)
+def _answer_logit_bias():
+    """
+    Logit bias favouring the letters, digits, spaces and newlines of answer lines.
+
+    Needs the optional tiktoken package to look up token ids; returns {} (no
+    bias) when it is missing or cannot load the encoding.
+    """
+    try:
+        import tiktoken
+        encoding = tiktoken.encoding_for_model(MODEL)
+    except Exception:
+        return {}
+
+    token_ids = set()
+    for ch in _ANSWER_CHARS:
+        token_ids.update(encoding.encode(ch))
+        if ch in "abcd":
+            token_ids.update(encoding.encode(" " + ch))
+    return {token_id: _ANSWER_BIAS for token_id in token_ids}
+
+def _request_body(prompt, questions_text, custom_prompt=None):
+    """
+    Chat completion parameters for a prompt.
+
+    With the default prompt, max_tokens is sized to the number of questions,
+    so the model cannot run on into explanations, and the output is biased
+    towards answer tokens. Custom prompts may ask for any output format, so
+    they get the flat MAX_TOKENS and no bias.
+    """
+    body = {
+        "model": MODEL,
+        "messages": _messages(prompt),
+        "temperature": TEMPERATURE,
+        "max_tokens": MAX_TOKENS
+    }
+    if custom_prompt:
+        return body
+
+    num_questions = len(_extract_questions(questions_text))
+    if num_questions:
+        body["max_tokens"] = TOKENS_PER_QUESTION * num_questions
+    logit_bias = _answer_logit_bias()
+    if logit_bias:
+        body["logit_bias"] = logit_bias
+    return body
+
+def generate_mcq_answers(questions_text, custom_prompt=None, use_cache=True, semantic_cache=None,
+                         on_token=None):
+    """
+    Generate answers for MCQ questions using the OpenAI API.
+
+    Responses are cached in CACHE_PATH keyed by the full request body, so
+    repeated runs on the same questions skip the API call. Pass
+    use_cache=False to always query the API. If a SemanticCache is given, it
+    is also consulted for reworded versions of earlier questions (default
+    prompt only).
+
+    If on_token is given, the API response is streamed and on_token is
+    called with each piece of text as it arrives. It is not called for
+    cached or fallback answers; the full answer string is returned either way.
+    """
+    _load_env()
+
     # Clean the input text
     clean_questions = clean_text(questions_text)
 
     # Check if API key is set
     if not API_KEY:
         print("OpenAI API key is not set. Using hardcoded answers for testing.")
-        # Extract questions and return answers in the format "1 b\n2 b\n3 d\n4 c"
-        questions = extract_mcq_questions(questions_text)
-
-        # Sample answers for testing - in a real scenario, these would come from the API
-        # These match the answers provided in the user's example
-        sample_answers = {
-            "1": "b",
-            "2": "b",
-            "3": "d",
-            "4": "c"
-        }
-
-        # Format the answers
-        formatted_answers = []
-        for num, _ in questions:
-            answer = sample_answers.get(num, "a")  # Default to "a" if question number not found
-            formatted_answers.append(f"{num} {answer}")
-
-        return "\n".join(formatted_answers)
+        return _hardcoded_fallback(questions_text)
 
     # Prepare the prompt
-    if custom_prompt:
-        prompt = custom_prompt.format(questions=clean_questions)
-    else:
-        prompt = DEFAULT_PROMPT_TEMPLATE.format(questions=clean_questions)
+    prompt = _build_prompt(clean_questions, custom_prompt)
+    body = _request_body(prompt, questions_text, custom_prompt)
+
+    # Identical requests are answered from the cache
+    key = _cache_key(body)
+    if use_cache:
+        cached = _cache_get(key)
+        if cached is not None:
+            return cached
+
+    # Near-duplicate question sets are answered from the semantic cache; the
+    # embeddings only cover the questions, so custom prompts are excluded
+    embedding = None
+    if semantic_cache is not None and not custom_prompt:
+        try:
+            embedding = semantic_cache.embed(clean_questions)
+            cached = semantic_cache.lookup(embedding)
+        except Exception as e:
+            print(f"Warning: semantic cache lookup failed ({e}); continuing without it.")
+            semantic_cache = embedding = cached = None
+        if cached is not None:
+            return cached
 
     try:
         # Create a request to the OpenAI API
-        response = openai.ChatCompletion.create(
-            model="gpt-3.5-turbo",
-            messages=[
-                {"role": "system", "content": "You are a model answer generator for MCQ papers."},
-                {"role": "user", "content": prompt}
-            ],
-            temperature=0.1,
-            max_tokens=150
-        )
-
-        # Extract and return the generated text
-        return response.choices[0].message.content.strip()
+        response = _openai_client().chat.completions.create(**body, stream=on_token is not None)
+
+        # Extract the generated text
+        if on_token is None:
+            answers = response.choices[0].message.content.strip()
+        else:
+            parts = []
+            for chunk in response:
+                token = chunk.choices[0].delta.content if chunk.choices else None
+                if token:
+                    parts.append(token)
+                    on_token = _show_token(on_token, token)
+            answers = "".join(parts).strip()
     except Exception as e:
         print(f"Error generating answers: {e}")
 
         # Fallback to hardcoded answers
         print("Falling back to hardcoded answers due to API error")
-        questions = extract_mcq_questions(questions_text)
-        sample_answers = {"1": "b", "2": "b", "3": "d", "4": "c"}
-        formatted_answers = []
-        for num, _ in questions:
-            answer = sample_answers.get(num, "a")
-            formatted_answers.append(f"{num} {answer}")
-        return "\n".join(formatted_answers)
+        return _hardcoded_fallback(questions_text)
+
+    # Remember the answers for next time; failures only cost the cache entries
+    if use_cache:
+        _cache_put(key, answers)
+    if embedding is not None:
+        try:
+            semantic_cache.add(embedding, clean_questions, answers)
+        except Exception as e:
+            print(f"Warning: could not write semantic cache: {e}")
+    return answers
+
+def _show_token(on_token, token):
+    """
+    Pass a streamed token to on_token, returning the callback to use for the next one.
+
+    A failing callback (e.g. a closed stdout) is dropped with a warning instead
+    of aborting the stream, so the answers are still returned and cached.
+    """
+    if on_token is None:
+        return None
+    try:
+        on_token(token)
+    except Exception as e:
+        print(f"Warning: could not show streamed answers: {e}", file=sys.stderr)
+        return None
+    return on_token
+
+def _pending_requests(texts, custom_prompt, use_cache):
+    """
+    Split question sets into cached answers and requests still to be sent.
+
+    Returns:
+        tuple: (answers list with None for misses, [(index, request body, cache key)])
+    """
+    answers = [None] * len(texts)
+    pending = []
+    for i, text in enumerate(texts):
+        prompt = _build_prompt(clean_text(text), custom_prompt)
+        body = _request_body(prompt, text, custom_prompt)
+        key = _cache_key(body)
+        cached = _cache_get(key) if use_cache else None
+        if cached is not None:
+            answers[i] = cached
+        else:
+            pending.append((i, body, key))
+    return answers, pending
+
+def _finish_requests(texts, answers, custom_prompt, use_cache):
+    """Answer any question sets the bulk request could not, one at a time."""
+    for i, text in enumerate(texts):
+        if answers[i] is None:
+            answers[i] = generate_mcq_answers(text, custom_prompt, use_cache=use_cache)
+    return answers
+
+async def _complete_concurrently(bodies, max_concurrent):
+    """Send requests concurrently, at most max_concurrent in flight at a time."""
+    semaphore = asyncio.Semaphore(max_concurrent)
+
+    # The client retries rate-limit, timeout and server errors with exponential backoff
+    async with _ensure_openai().AsyncOpenAI(api_key=API_KEY, max_retries=5) as client:
+        async def complete(body):
+            async with semaphore:
+                response = await client.chat.completions.create(**body)
+                return response.choices[0].message.content.strip()
+
+        return await asyncio.gather(*(complete(body) for body in bodies), return_exceptions=True)
+
+def generate_mcq_answers_parallel(texts, custom_prompt=None, use_cache=True, max_concurrent=10):
+    """
+    Generate answers for several question sets with concurrent API requests.
+
+    Question sets whose request fails are retried through
+    generate_mcq_answers, which falls back to hardcoded answers.
+
+    Returns:
+        list: The answers for each question set, in the order of texts.
+    """
+    _load_env()
+    if not API_KEY:
+        return [generate_mcq_answers(text, custom_prompt) for text in texts]
+
+    answers, pending = _pending_requests(texts, custom_prompt, use_cache)
+    if pending:
+        try:
+            results = asyncio.run(_complete_concurrently([body for _, body, _ in pending], max_concurrent))
+        except Exception as e:
+            print(f"Error generating answers: {e}")
+            results = [e] * len(pending)
+
+        for (i, _, key), result in zip(pending, results):
+            if isinstance(result, Exception):
+                print(f"Error generating answers for question set {i + 1}: {result}")
+                continue
+            answers[i] = result
+            if use_cache:
+                _cache_put(key, result)
+
+    return _finish_requests(texts, answers, custom_prompt, use_cache)
+
+def generate_mcq_answers_batch(texts, custom_prompt=None, use_cache=True, poll_interval=30):
+    """
+    Generate answers for several question sets through the OpenAI Batch API.
+
+    Batches cost half as much as regular requests but may take up to 24 hours;
+    this blocks, polling every poll_interval seconds, until the batch ends.
+    Question sets without a result are retried through generate_mcq_answers.
+
+    Returns:
+        list: The answers for each question set, in the order of texts.
+    """
+    _load_env()
+    if not API_KEY:
+        return [generate_mcq_answers(text, custom_prompt) for text in texts]
+
+    answers, pending = _pending_requests(texts, custom_prompt, use_cache)
+    if pending:
+        try:
+            client = _openai_client()
+
+            # One JSONL line per request, matched back up by custom_id
+            lines = [
+                json.dumps({
+                    "custom_id": str(i),
+                    "method": "POST",
+                    "url": "/v1/chat/completions",
+                    "body": body
+                })
+                for i, body, _ in pending
+            ]
+            batch_file = client.files.create(
+                file=("mcq_batch.jsonl", "\n".join(lines).encode("utf-8")),
+                purpose="batch"
+            )
+            batch = client.batches.create(
+                input_file_id=batch_file.id,
+                endpoint="/v1/chat/completions",
+                completion_window="24h"
+            )
+            print(f"Submitted batch {batch.id} with {len(pending)} request(s); waiting for it to finish...")
+
+            while batch.status not in ("completed", "failed", "expired", "cancelled"):
+                time.sleep(poll_interval)
+                batch = client.batches.retrieve(batch.id)
+
+            if batch.status != "completed" or not batch.output_file_id:
+                raise RuntimeError(f"batch {batch.id} ended with status {batch.status}")
+
+            keys = {i: key for i, _, key in pending}
+            for line in client.files.content(batch.output_file_id).text.splitlines():
+                item = json.loads(line)
+                response = item.get("response") or {}
+                if response.get("status_code") != 200:
+                    continue
+                i = int(item["custom_id"])
+                answers[i] = response["body"]["choices"][0]["message"]["content"].strip()
+                if use_cache:
+                    _cache_put(keys[i], answers[i])
+        except Exception as e:
+            print(f"Error generating answers with the Batch API: {e}")
+
+    return _finish_requests(texts, answers, custom_prompt, use_cache)
+
+def _read_questions_file(path):
+    """Read a questions file, through a memory map when it is a regular file, decoding it as UTF-8."""
+    with open(path, 'rb') as f:
+        # mmap refuses empty files and cannot map pipes, FIFOs or terminals
+        st = os.fstat(f.fileno())
+        if not stat.S_ISREG(st.st_mode) or st.st_size == 0:
+            return f.read().decode('utf-8')
+        with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+            return str(mm, 'utf-8')
 
 def main():
     """Main function to parse arguments and generate MCQ answers."""
@@ -146,44 +569,108 @@ def main():
     # Add arguments
     input_group = parser.add_mutually_exclusive_group(required=True)
     input_group.add_argument("questions", nargs="?", help="MCQ questions text")
-    input_group.add_argument("--file", help="Path to a file containing MCQ questions")
+    input_group.add_argument("--file", help="Path or glob pattern of files containing MCQ questions")
 
     parser.add_argument("--prompt", help="Custom prompt template (use {questions} as placeholder)")
     parser.add_argument("--output", help="Output file path (if not specified, prints to console)")
+    parser.add_argument("--no-cache", action="store_true", help="Always query the API instead of reusing cached answers")
+    parser.add_argument("--semantic-cache", action="store_true",
+                        help="Also reuse answers for near-duplicate questions (needs sentence-transformers and faiss)")
+    parser.add_argument("--batch", action="store_true",
+                        help="Send all files through the OpenAI Batch API (half price, may take up to 24h)")
+    parser.add_argument("--concurrency", type=int, default=10,
+                        help="Maximum concurrent API requests when answering several files (default: 10)")
 
     # Parse arguments
     args = parser.parse_args()
+    if args.concurrency < 1:
+        parser.error("--concurrency must be at least 1")
+    use_cache = not args.no_cache
 
-    # Get questions text from either direct input or file
+    # Get questions text from either direct input or file(s)
     if args.file:
+        # A file that exists is taken literally, even if its name has glob characters
+        paths = [args.file] if os.path.exists(args.file) else sorted(glob.glob(args.file))
+        if not paths:
+            print(f"Error reading file: no file matches {args.file}")
+            sys.exit(1)
         try:
-            with open(args.file, 'r', encoding='utf-8') as f:
-                questions_text = f.read()
+            texts = []
+            for path in paths:
+                texts.append(_read_questions_file(path))
         except Exception as e:
             print(f"Error reading file: {e}")
             sys.exit(1)
     else:
-        questions_text = args.questions
+        paths = [None]
+        texts = [args.questions]
 
     # Generate answers
-    answers = generate_mcq_answers(questions_text, args.prompt)
-
-    # Output the results
-    if answers:
-        if args.output:
+    if args.batch:
+        answers_list = generate_mcq_answers_batch(texts, args.prompt, use_cache=use_cache)
+    elif len(texts) > 1:
+        answers_list = generate_mcq_answers_parallel(texts, args.prompt, use_cache=use_cache,
+                                                     max_concurrent=args.concurrency)
+    else:
+        # Set up the optional semantic cache
+        semantic_cache = None
+        if args.semantic_cache and use_cache:
             try:
-                with open(args.output, 'w', encoding='utf-8') as f:
-                    f.write(answers)
-                print(f"Answers written to {args.output}")
+                semantic_cache = SemanticCache()
             except Exception as e:
-                print(f"Error writing to output file: {e}")
+                # Missing packages, a failed model download or an unreadable index
+                print(f"Semantic cache unavailable ({e}); continuing without it.")
+
+        # Print console answers as they stream in
+        streamed = []
+
+        def show_token(token):
+            if not streamed:
+                token = token.lstrip()
+                if not token:
+                    return
+                print("\nGenerated Answers:")
+                print("==================")
+            streamed.append(token)
+            sys.stdout.write(token)
+            sys.stdout.flush()
+
+        answers_list = [generate_mcq_answers(texts[0], args.prompt, use_cache=use_cache,
+                                             semantic_cache=semantic_cache,
+                                             on_token=None if args.output else show_token)]
+
+        if streamed:
+            streamed_text = "".join(streamed)
+            if not streamed_text.endswith("\n"):
+                print()
+            print("==================")
+            # Unless the stream broke off and the answers came from the fallback
+            if answers_list[0] == streamed_text.strip():
+                return
+
+    # Output the results
+    labelled = len(texts) > 1
+    if args.output:
+        if labelled:
+            output = "\n\n".join(f"# {path}\n{answers}" for path, answers in zip(paths, answers_list))
         else:
-            print("\nGenerated Answers:")
+            output = answers_list[0]
+        try:
+            with open(args.output, 'w', encoding='utf-8') as f:
+                f.write(output)
+            print(f"Answers written to {args.output}")
+        except Exception as e:
+            print(f"Error writing to output file: {e}")
+        return
+
+    for path, answers in zip(paths, answers_list):
+        if answers:
+            print(f"\nGenerated Answers ({path}):" if labelled else "\nGenerated Answers:")
             print("==================")
             print(answers)
             print("==================")
-    else:
-        print("Failed to generate answers.")
+        else:
+            print(f"Failed to generate answers for {path}." if labelled else "Failed to generate answers.")
 
 if __name__ == "__main__":
     main()
@@ -1,28 +1,47 @@
 import http.server
-import socketserver
 import json
+import sys
+
+# orjson is optional; fall back to the stdlib json module when it is missing
+try:
+    import orjson
+except ImportError:
+    orjson = None
 
 # Define the port
 PORT = 3000
 
+# Echo request bodies to the console only when started with --verbose
+VERBOSE = '--verbose' in sys.argv[1:]
+
+def json_bytes(obj):
+    """Serializes obj as UTF-8 JSON bytes, using orjson when available."""
+    if orjson is not None:
+        return orjson.dumps(obj)
+    return json.dumps(obj).encode()
+
+# Fixed parts of the GET response around the JSON-encoded path
+_GET_PREFIX = b'{"message":"Server is working!","path":'
+_GET_SUFFIX = b',"method":"GET"}'
+
 # Create a custom request handler
 class MyHandler(http.server.SimpleHTTPRequestHandler):
-    def do_GET(self):
+    # Keep connections open between requests; needs Content-Length on every response
+    protocol_version = "HTTP/1.1"
+
+    def send_json(self, body):
         # Set CORS headers
         self.send_response(200)
         self.send_header('Content-type', 'application/json')
+        self.send_header('Content-Length', str(len(body)))
         self.send_header('Access-Control-Allow-Origin', '*')
         self.end_headers()
         
-        # Create a response
-        response = {
-            'message': 'Server is working!',
-            'path': self.path,
-            'method': 'GET'
-        }
-        
         # Send the response
-        self.wfile.write(json.dumps(response).encode())
+        self.wfile.write(body)
+    
+    def do_GET(self):
+        self.send_json(_GET_PREFIX + json_bytes(self.path) + _GET_SUFFIX)
         
         # Print request info
         print(f"Request received: GET {self.path}")
@@ -32,31 +51,24 @@ class MyHandler(http.server.SimpleHTTPRequestHandler):
         content_length = int(self.headers['Content-Length'])
         
         # Read the request body
-        post_data = self.rfile.read(content_length)
-        
-        # Set CORS headers
-        self.send_response(200)
-        self.send_header('Content-type', 'application/json')
-        self.send_header('Access-Control-Allow-Origin', '*')
-        self.end_headers()
+        post_data = self.rfile.read(content_length).decode('utf-8')
         
         # Create a response
         response = {
             'message': 'Server is working!',
             'path': self.path,
             'method': 'POST',
-            'received_data': post_data.decode('utf-8')
+            'received_data': post_data
         }
-        
-        # Send the response
-        self.wfile.write(json.dumps(response).encode())
+        self.send_json(json_bytes(response))
         
         # Print request info
         print(f"Request received: POST {self.path}")
-        print(f"Request body: {post_data.decode('utf-8')}")
+        if VERBOSE:
+            print(f"Request body: {post_data}")
 
-# Create and start the server
-with socketserver.TCPServer(("", PORT), MyHandler) as httpd:
+# Create and start the server (one thread per connection)
+with http.server.ThreadingHTTPServer(("", PORT), MyHandler) as httpd:
     print(f"Python HTTP server running at http://localhost:{PORT}/")
     print("Server will respond to any request with a simple JSON message")
     print("Press Ctrl+C to stop the server")
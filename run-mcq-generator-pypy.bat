@@ -0,0 +1,15 @@
+@echo off
+echo Starting MCQ answer generator...
+echo.
+
+rem PyPy's JIT speeds up the text cleaning and fallback paths; use it when installed
+where pypy3 >nul 2>nul
+if %errorlevel% equ 0 (
+  pypy3 openai_mcq_generator.py %*
+) else (
+  echo PyPy not found, using python3 instead.
+  python3 openai_mcq_generator.py %*
+)
+
+echo.
+pause